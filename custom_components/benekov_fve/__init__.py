@@ -1,21 +1,27 @@
 """The Benekov FVE Monitor integration."""
+from datetime import timedelta
+
 from homeassistant.core import HomeAssistant
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
 from homeassistant.const import CONF_URL, CONF_USERNAME, CONF_PASSWORD
-from homeassistant.exceptions import ConfigEntryNotReady
-from .const import DOMAIN, LOGGER
+from .api import BenekovFVEAPI, DEFAULT_SCAN_INTERVAL
+from .const import CONF_DEBUG_SERVICES, DOMAIN, LOGGER
+from .coordinator import BenekovCoordinator
 import logging
 
 _LOGGER = LOGGER or logging.getLogger(__name__)
 
+PLATFORMS = ["sensor"]
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Benekov FVE Monitor from a config entry.
 
-    Perform a quick connectivity test before forwarding setup to platforms.
-    If the external API is not reachable, raise `ConfigEntryNotReady` so
-    Home Assistant will retry setup later, rather than forwarding the
-    config entry to platforms which may fail.
+    Create a single `BenekovCoordinator` per entry and perform its first
+    refresh before forwarding setup to platforms. If the external API is not
+    reachable, the first refresh raises `ConfigEntryNotReady` so Home
+    Assistant will retry setup later, rather than forwarding the config
+    entry to platforms which may fail.
     """
 
     hass.data.setdefault(DOMAIN, {})
@@ -25,95 +31,72 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data[DOMAIN].setdefault(entry.entry_id, {})
     hass.data[DOMAIN][entry.entry_id]["config"] = entry.data
 
-    # Lazy import API to avoid import-time side effects
-    try:
-        from .sensor import BenekovFVEAPI
-    except Exception as err:
-        _LOGGER.exception("Failed to import BenekovFVEAPI during setup: %s", err)
-        raise ConfigEntryNotReady from err
-
     url = entry.data.get(CONF_URL)
     c_monitor = entry.data.get(CONF_USERNAME)
     t_monitor = entry.data.get(CONF_PASSWORD)
+    scan_interval_s = entry.data.get("scan_interval", DEFAULT_SCAN_INTERVAL.seconds)
+
+    # One API instance per entry so every consumer shares its pooled session
+    api = await BenekovFVEAPI(hass, url, c_monitor, t_monitor).__aenter__()
+
+    coordinator = BenekovCoordinator(hass, api, timedelta(seconds=scan_interval_s))
+
+    # The first refresh doubles as the connectivity probe and raises
+    # ConfigEntryNotReady on its own when the fetch fails.
+    await coordinator.async_config_entry_first_refresh()
+
+    # Share the API and coordinator with platforms, services and diagnostics
+    hass.data[DOMAIN][entry.entry_id]["api"] = api
+    hass.data[DOMAIN][entry.entry_id]["coordinator"] = coordinator
+
+    # Forward setup to the sensor platform after connectivity verified. This
+    # is deliberately not gathered with the first refresh: platforms must not
+    # be set up for an entry that may still raise ConfigEntryNotReady, and
+    # sensor names depend on the system name from the first payload. Home
+    # Assistant already sets up separate config entries concurrently.
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    api = BenekovFVEAPI(hass, url, c_monitor, t_monitor)
+    # Troubleshooting services are opt-in per entry via the options flow
+    if entry.options.get(CONF_DEBUG_SERVICES):
+        from .debug import async_register_services
 
-    try:
-        info = await hass.async_add_executor_job(api.get_data)
-        # Treat explicit API error responses as not ready
-        if isinstance(info, dict) and info.get("error"):
-            _LOGGER.error("API reported error during initial setup: %s", info.get("error"))
-            raise ConfigEntryNotReady("API error during initial setup")
-    except ConfigEntryNotReady:
-        raise
-    except Exception as err:
-        _LOGGER.exception("Initial connection to Benekov FVE API failed: %s", err)
-        raise ConfigEntryNotReady from err
+        async_register_services(hass)
 
-    # Forward setup to the sensor platform after connectivity verified
-    await hass.config_entries.async_forward_entry_setups(entry, ["sensor"])
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    unload_ok = await hass.config_entries.async_forward_entry_unload(entry, "sensor")
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        domain_data = hass.data.get(DOMAIN, {})
+        entry_container = domain_data.pop(entry.entry_id, None) or {}
+        api = entry_container.get("api")
+        if api is not None:
+            await api.__aexit__(None, None, None)
+
+        # Last entry gone: free the domain container
+        if not domain_data:
+            hass.data.pop(DOMAIN, None)
+
+        # The debug service is global; keep it only while another loaded
+        # entry still has the option enabled.
+        debug_still_wanted = any(
+            other.options.get(CONF_DEBUG_SERVICES)
+            for other in hass.config_entries.async_entries(DOMAIN)
+            if other.entry_id != entry.entry_id and other.state is ConfigEntryState.LOADED
+        )
+        if not debug_still_wanted and hass.services.has_service(DOMAIN, "get_wifi"):
+            from .debug import async_remove_services
+
+            async_remove_services(hass)
 
     return unload_ok
-
-
-async def async_setup(hass: HomeAssistant, config: dict) -> bool:
-    """Set up the integration and register a simple debug service.
-
-    The service `benekov_fve.get_wifi` accepts optional `entry_id` and
-    logs the current `wifi_percent` value (from coordinator data if
-    available, otherwise performs a one-off API call in the executor).
-    This is a lightweight troubleshooting helper and can be removed later.
-    """
-    from .const import DOMAIN
-
-    async def _handle_get_wifi(call):
-        entry_id = call.data.get("entry_id") if call.data else None
-        hass.data.setdefault(DOMAIN, {})
-
-        # If no entry_id provided and exactly one entry is configured, use it
-        if not entry_id:
-            entries = list(hass.data[DOMAIN].keys())
-            if len(entries) == 1:
-                entry_id = entries[0]
-
-        if not entry_id or entry_id not in hass.data[DOMAIN]:
-            _LOGGER.error("benekov_fve.get_wifi: entry_id not provided or unknown")
-            return
-
-        entry_container = hass.data[DOMAIN].get(entry_id, {})
-        coordinator = entry_container.get("coordinator")
-        wifi = None
-
-        if coordinator is not None and getattr(coordinator, "data", None) is not None:
-            wifi = coordinator.data.get("wifi_percent")
-        else:
-            # Try a one-off API call
-            try:
-                from .sensor import BenekovFVEAPI
-                from homeassistant.const import CONF_URL, CONF_USERNAME, CONF_PASSWORD
-
-                cfg = entry_container.get("config") or {}
-                api = BenekovFVEAPI(hass, cfg.get(CONF_URL), cfg.get(CONF_USERNAME), cfg.get(CONF_PASSWORD))
-                result = await hass.async_add_executor_job(api.get_data)
-                if isinstance(result, dict):
-                    wifi = result.get("wifi_percent")
-            except Exception as err:
-                _LOGGER.exception("benekov_fve.get_wifi: API call failed: %s", err)
-
-        _LOGGER.info("benekov_fve.get_wifi: entry_id=%s wifi_percent=%s", entry_id, wifi)
-        # Fire an event so users can capture the result programmatically
-        hass.bus.async_fire("benekov_fve_wifi", {"entry_id": entry_id, "wifi_percent": wifi})
-
-    hass.services.async_register(DOMAIN, "get_wifi", _handle_get_wifi)
-
-    return True
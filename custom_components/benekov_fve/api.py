@@ -0,0 +1,189 @@
+"""Client for the external Benekov FVE monitoring API."""
+import asyncio
+import logging
+from datetime import timedelta
+from urllib.parse import urlencode
+
+import aiohttp
+from yarl import URL
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+# Compatibility: Home Assistant's json_loads picks the fastest available
+# parser (orjson); on older cores use orjson directly, then the stdlib.
+try:
+    from homeassistant.util.json import json_loads
+except ImportError:
+    try:
+        from orjson import loads as json_loads
+    except ImportError:
+        from json import loads as json_loads
+
+# Logger
+_LOGGER = logging.getLogger(__name__)
+
+# Default to 5 seconds as requested
+DEFAULT_SCAN_INTERVAL = timedelta(seconds=5)
+
+_FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+
+_MISSING = object()
+
+# (output key, top-level JSON key, default) for values copied as-is
+_DIRECT = (
+    ("last_update", "posledniZaznam", "N/A"),
+    ("time_of_day", "castDne", "N/A"),
+    ("wifi_percent", "wifiProc", 0),
+
+    # Power Flows (W)
+    ("inverter_output_w", "Inverter output total power", 0),
+    ("total_consumption_w", "spotrebaCelkem", 0),
+    ("grid_power_w", "vykonSit", 0),
+    ("battery_power_w", "vykonBat", 0),
+)
+
+# (output key, JSON key path, default) for values read via a key path
+_FIELDS = (
+    ("inverter_temp_c", ("teplotaStridace",), 0.0),
+
+    # Battery Status
+    ("battery_soc_percent", ("baterie", "soc"), 0),
+    ("battery_voltage_v", ("baterie", "napeti"), 0.0),
+    ("battery_current_a", ("baterie", "proud"), 0.0),
+    ("battery_temp_c", ("baterie", "teplota"), 0),
+
+    # Daily Statistics (kWh)
+    ("daily_purchase_kwh", ("statistika", "denni", "NakupEnergie"), 0.0),
+    ("daily_charge_kwh", ("statistika", "denni", "NabitiBaterie"), 0.0),
+    ("daily_discharge_kwh", ("statistika", "denni", "VybitiBaterie"), 0.0),
+
+    # Solar Panel production
+    ("fpv_power_total_w", ("vykonFV",), 0),
+    ("fpv_power_string_1_w", ("vykonFV1",), 0),
+    ("fpv_power_string_2_w", ("vykonFV2",), 0),
+    ("fpv_power_string_3_w", ("vykonFV3",), 0),
+    ("fpv_power_string_4_w", ("vykonFV4",), 0),
+
+    ("fpv_voltage_string1_v", ("napetiFV1",), 0.0),
+    ("fpv_voltage_string2_v", ("napetiFV2",), 0.0),
+    ("fpv_voltage_string3_v", ("napetiFV3",), 0.0),
+    ("fpv_voltage_string4_v", ("napetiFV4",), 0.0),
+
+    # Unit Status
+    ("unit_l1_v", ("stridacL1Voltage",), 0),
+    ("unit_l2_v", ("stridacL2Voltage",), 0),
+    ("unit_l3_v", ("stridacL3Voltage",), 0.0),
+    ("unit_frequency_hz", ("stridacFrequency",), 0.0),
+
+    # Charger Status
+    ("charger_2_status", ("nabijecka", "nabijecka2", "stavKonektoru"), "N/A"),
+)
+
+
+class BenekovFVEAPI:
+    """Handles communication with the external Benekov FVE API."""
+
+    def __init__(self, hass: HomeAssistant, url: str, c_monitor: str, t_monitor: str):
+        """Initialize the API handler."""
+        self.hass = hass
+        self.url = url
+        # Parse the fixed URL once instead of letting aiohttp do it per request
+        self._url = URL(url)
+        self.payload = {
+            'c_monitor': c_monitor,
+            't_session': t_monitor
+        }
+        # The payload never changes, so encode the form body only once
+        self._body = urlencode(self.payload).encode("ascii")
+        # Last raw response and its parsed result, reused while unchanged
+        self._last_raw = None
+        self._last_output = None
+        self.system_id = None # Will store a unique ID for device info
+        self.system_name = "Benekov FVE System"
+        self._session = None
+
+    async def __aenter__(self):
+        """Bind the API to Home Assistant's shared (keep-alive) aiohttp session."""
+        self._session = async_get_clientsession(self.hass)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        """Release the session reference; Home Assistant owns and closes it."""
+        self._session = None
+
+    async def async_get_data(self):
+        """Fetch and parse data natively on the event loop using aiohttp."""
+        if self._session is None:
+            self._session = async_get_clientsession(self.hass)
+        try:
+            async with self._session.post(
+                self._url,
+                data=self._body,
+                headers=_FORM_HEADERS,
+                timeout=aiohttp.ClientTimeout(total=10),
+            ) as response:
+                # Drain the body before checking the status so that even error
+                # responses leave the keep-alive connection reusable.
+                raw = await response.read()
+                response.raise_for_status()
+
+            # The inverter often reports the same record several polls in a
+            # row; skip re-parsing an identical body.
+            if raw == self._last_raw:
+                return self._last_output
+
+            output = self._parse_energy_status(raw)
+            self._last_raw = raw
+            self._last_output = output
+            return output
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            _LOGGER.error("Failed to fetch data from API (aiohttp): %s", e)
+            raise UpdateFailed(f"API communication failed: {e}") from e
+
+    def _parse_energy_status(self, raw):
+        """Parses the raw JSON payload (bytes or str) into a flat dictionary.
+
+        Bytes are handed to the parser as-is; both orjson and the stdlib
+        decode UTF-8 themselves, so no intermediate `str` is built.
+        """
+        try:
+            data = json_loads(raw)
+        except ValueError:
+            _LOGGER.error("Failed to decode JSON from API: %s", raw)
+            return {"error": "JSON_DECODE_FAILED"}
+
+        # Ensure we received a mapping/dictionary. If not, bail out early.
+        if not isinstance(data, dict):
+            _LOGGER.error("API returned non-dict JSON payload: %s", repr(data))
+            return {"error": "INVALID_PAYLOAD", "payload": data}
+
+        # Every lookup below falls back to a default, so flattening a dict
+        # payload cannot raise; genuinely unexpected bugs propagate to HA.
+
+        # Store unique ID (uid) for the device
+        # Use the UID from the data, or a fallback.
+        self.system_id = data.get("uid", "unknown_benekov_system")
+        # Read and strip the account name once; it feeds both names
+        name = data.get("jmeno")
+        name = str(name).strip() if name is not None else ""
+        self.system_name = name or "Benekov FVE System"
+
+        # Create the flat output dictionary
+        output = {dest: data.get(src, default) for dest, src, default in _DIRECT}
+        output["user_name"] = name or "Unknown User"
+
+        # Walk the (possibly nested) key paths; fall back to the default
+        # as soon as a level is missing or is not a mapping.
+        for dest, path, default in _FIELDS:
+            value = data
+            for key in path:
+                value = value.get(key, _MISSING) if isinstance(value, dict) else _MISSING
+                if value is _MISSING:
+                    value = default
+                    break
+            output[dest] = value
+
+        return output
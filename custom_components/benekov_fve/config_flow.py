@@ -3,15 +3,18 @@
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.update_coordinator import UpdateFailed
 from homeassistant.const import CONF_URL, CONF_USERNAME, CONF_PASSWORD
 
-from .const import DOMAIN
+from .api import BenekovFVEAPI, DEFAULT_SCAN_INTERVAL
+from .const import CONF_DEBUG_SERVICES, DOMAIN
 import logging
 _LOGGER = logging.getLogger(__name__)
 
 # --- Data Schema for the Configuration Form ---
+# Built once at import and reused by every flow step.
 DATA_SCHEMA = vol.Schema(
     {
         # Use cv.string here because some HA frontends cannot convert
@@ -21,7 +24,8 @@ DATA_SCHEMA = vol.Schema(
         vol.Required(CONF_USERNAME, description={"suggested_value": "c_monitor"}): cv.string,
         vol.Required(CONF_PASSWORD, description={"suggested_value": "t_monitor"}): cv.string,
         vol.Optional("scan_interval", default=10): cv.positive_int,
-    }
+    },
+    extra=vol.PREVENT_EXTRA,
 )
 
 
@@ -30,11 +34,17 @@ class BenekovFVEConfigFlow(config_entries.ConfigFlow):
     """Handle a config flow for the Benekov FVE Monitor integration.
 
     This implementation performs a connectivity test by calling the API
-    inside Home Assistant's executor and returns helpful form errors.
+    directly on the event loop and returns helpful form errors.
     """
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry):
+        """Return the options flow handler."""
+        return BenekovFVEOptionsFlow(config_entry)
+
     async def async_step_user(self, user_input=None):
         """Handle the initial step."""
         errors = {}
@@ -43,13 +53,13 @@ class BenekovFVEConfigFlow(config_entries.ConfigFlow):
             url = user_input[CONF_URL]
             c_monitor = user_input[CONF_USERNAME]
             t_monitor = user_input[CONF_PASSWORD]
-            scan_interval_s = user_input.get("scan_interval", 5)
+            scan_interval_s = user_input.get("scan_interval", DEFAULT_SCAN_INTERVAL.seconds)
 
             # Validate URL value here (so the UI schema stays simple).
             try:
                 # cv.url raises vol.Invalid on invalid URL
                 cv.url(url)
-            except Exception:
+            except vol.Invalid:
                 errors[CONF_URL] = "invalid_url"
                 return self.async_show_form(
                     step_id="user",
@@ -57,15 +67,13 @@ class BenekovFVEConfigFlow(config_entries.ConfigFlow):
                     errors=errors,
                 )
 
-            # Import API lazily to avoid import-time failures
-            from .sensor import BenekovFVEAPI
-
             api = BenekovFVEAPI(self.hass, url, c_monitor, t_monitor)
             
             # Test connectivity before saving
             try:
-                # Use hass.async_add_executor_job for blocking I/O (like standard HTTP requests)
-                info = await self.hass.async_add_executor_job(api.get_data)
+                # The API client is aiohttp-based, so await it directly
+                async with api:
+                    info = await api.async_get_data()
                 
                 # Check for an explicit API error response
                 if isinstance(info, dict) and 'error' in info:
@@ -87,6 +95,9 @@ class BenekovFVEConfigFlow(config_entries.ConfigFlow):
                             "scan_interval": scan_interval_s,
                         },
                     )
+            except UpdateFailed as e:
+                _LOGGER.error("Failed to connect to Benekov FVE Monitor: %s", e)
+                errors["base"] = "cannot_connect"
             except Exception as e:
                 _LOGGER.exception("Failed to connect or retrieve data from Benekov FVE Monitor")
                 errors["base"] = "cannot_connect" # Network or general HTTP error
@@ -98,3 +109,27 @@ class BenekovFVEConfigFlow(config_entries.ConfigFlow):
             errors=errors,
         )
 
+
+class BenekovFVEOptionsFlow(config_entries.OptionsFlow):
+    """Handle options for an existing Benekov FVE Monitor entry."""
+
+    def __init__(self, config_entry):
+        """Initialize the options flow."""
+        self._entry = config_entry
+
+    async def async_step_init(self, user_input=None):
+        """Toggle the opt-in troubleshooting services."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_DEBUG_SERVICES,
+                        default=self._entry.options.get(CONF_DEBUG_SERVICES, False),
+                    ): cv.boolean,
+                }
+            ),
+        )
@@ -5,3 +5,5 @@ from logging import Logger, getLogger
 LOGGER: Logger = getLogger(__package__)
 
 DOMAIN = "benekov_fve"
+
+CONF_DEBUG_SERVICES = "debug_services"
@@ -0,0 +1,67 @@
+"""Data update coordinator for Benekov FVE Monitor."""
+from datetime import timedelta
+import logging
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class BenekovCoordinator(DataUpdateCoordinator):
+    """Coordinator that only polls the API while entities are subscribed."""
+
+    def __init__(self, hass: HomeAssistant, api, update_interval: timedelta):
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_interval=update_interval,
+        )
+        self.api = api
+        # Per-poll cache of the attribute dicts shared by all sensors
+        self._attrs_cache = {}
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Drop the cached attributes whenever new data is published."""
+        self._attrs_cache = {}
+        super().async_update_listeners()
+
+    def shared_attributes(self, state_attr_key=None) -> dict:
+        """Return the extra state attributes for the current data.
+
+        Sensors with the same `state_attr_key` get the same dict instance,
+        built once per update; callers must treat it as read-only.
+        """
+        attrs = self._attrs_cache.get(state_attr_key)
+        if attrs is None:
+            data = self.data if isinstance(self.data, dict) else {}
+            attrs = {
+                "Charger 2 Status": data.get("charger_2_status"),
+                "Time of Day": data.get("time_of_day"),
+            }
+            # For the daily purchase sensor, also show the last update time as an attribute
+            if state_attr_key and data.get(state_attr_key):
+                attrs["Last Update Time"] = data.get(state_attr_key)
+            self._attrs_cache[state_attr_key] = attrs
+        return attrs
+
+    async def _async_update_data(self):
+        """Fetch data from the API, skipping the request when nobody listens.
+
+        The very first refresh always fetches so setup can verify
+        connectivity before any entity has been added.
+        """
+        if self.data is not None and not list(self.async_contexts()):
+            _LOGGER.debug("No subscribed entities, skipping Benekov FVE poll")
+            return self.data
+        data = await self.api.async_get_data()
+        # Translate explicit API error responses into a failed update; the
+        # first refresh turns this into ConfigEntryNotReady.
+        if isinstance(data, dict) and data.get("error"):
+            raise UpdateFailed(f"API reported error: {data.get('error')}")
+        return data
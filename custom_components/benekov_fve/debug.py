@@ -0,0 +1,66 @@
+"""Troubleshooting services for Benekov FVE Monitor.
+
+Only imported when a config entry enables the `debug_services` option.
+"""
+import logging
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.const import MATCH_ALL
+import homeassistant.helpers.config_validation as cv
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_GET_WIFI = "get_wifi"
+EVENT_WIFI = "benekov_fve_wifi"
+
+SERVICE_SCHEMA = vol.Schema({vol.Optional("entry_id"): cv.string})
+
+
+def async_register_services(hass: HomeAssistant) -> None:
+    """Register the debug services (once for all entries).
+
+    The service `benekov_fve.get_wifi` accepts optional `entry_id` and
+    logs the current `wifi_percent` value from the entry's coordinator
+    data, without performing any additional API calls.
+    """
+    if hass.services.has_service(DOMAIN, SERVICE_GET_WIFI):
+        return
+
+    async def _handle_get_wifi(call: ServiceCall):
+        entry_id = call.data.get("entry_id")
+        domain_data = hass.data.setdefault(DOMAIN, {})
+
+        # If no entry_id provided and exactly one entry is configured, use it
+        if not entry_id:
+            entries = list(domain_data)
+            if len(entries) == 1:
+                entry_id = entries[0]
+
+        entry_container = domain_data.get(entry_id) if entry_id else None
+        if entry_container is None:
+            _LOGGER.error("benekov_fve.get_wifi: entry_id not provided or unknown")
+            return
+
+        coordinator = entry_container.get("coordinator")
+        wifi = None
+
+        if coordinator is not None and getattr(coordinator, "data", None) is not None:
+            wifi = coordinator.data.get("wifi_percent")
+
+        _LOGGER.info("benekov_fve.get_wifi: entry_id=%s wifi_percent=%s", entry_id, wifi)
+        # Fire an event so users can capture the result programmatically, but
+        # only when something (including catch-all listeners) subscribes to it.
+        listeners = hass.bus.async_listeners()
+        if listeners.get(EVENT_WIFI) or listeners.get(MATCH_ALL):
+            hass.bus.async_fire(EVENT_WIFI, {"entry_id": entry_id, "wifi_percent": wifi})
+
+    hass.services.async_register(DOMAIN, SERVICE_GET_WIFI, _handle_get_wifi, schema=SERVICE_SCHEMA)
+
+
+def async_remove_services(hass: HomeAssistant) -> None:
+    """Remove the debug services."""
+    hass.services.async_remove(DOMAIN, SERVICE_GET_WIFI)
@@ -5,7 +5,6 @@ from typing import Any
 
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.components.diagnostics import async_redact_data
 
 from .const import DOMAIN
 
@@ -21,6 +20,19 @@ async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigE
     """
     _LOGGER.debug("async_get_config_entry_diagnostics called for entry=%s", entry.entry_id)
 
+    entry_container = hass.data.get(DOMAIN, {}).get(entry.entry_id, {})
+    coordinator = entry_container.get("coordinator")
+
+    # Never construct a separate API client here. If the coordinator has not
+    # populated yet, ask it to refresh; concurrent requests are debounced.
+    if coordinator is not None and coordinator.data is None:
+        await coordinator.async_request_refresh()
+
+    data = (coordinator.data if coordinator is not None else None) or {}
+
     return {
         "Diaggnostics fetched successfully": "Yes",
+        "last_update_success": getattr(coordinator, "last_update_success", None),
+        "wifi_percent": data.get("wifi_percent"),
+        "last_update": data.get("last_update"),
     }
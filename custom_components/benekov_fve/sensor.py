@@ -1,17 +1,10 @@
-import logging
-import json
-from datetime import timedelta
-import socket
-import ssl
-from urllib.parse import urlparse, urlencode
-
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant import const as ha_const
-from homeassistant.const import CONF_URL, CONF_USERNAME, CONF_PASSWORD
+
+from .const import DOMAIN
 
 # Compatibility: use Home Assistant constants when available, otherwise
 # fall back to literal strings so the integration works across HA versions.
@@ -29,352 +22,90 @@ DEVICE_CLASS_VOLTAGE = getattr(ha_const, "DEVICE_CLASS_VOLTAGE", "voltage")
 DEVICE_CLASS_CURRENT = getattr(ha_const, "DEVICE_CLASS_CURRENT", "current")
 DEVICE_CLASS_BATTERY = getattr(ha_const, "DEVICE_CLASS_BATTERY", "battery")
 
-# Logger
-_LOGGER = logging.getLogger(__name__)
-
-# Default to 5 seconds as requested
-DEFAULT_SCAN_INTERVAL = timedelta(seconds=5)
-
-class BenekovFVEAPI:
-    """Handles communication with the external Benekov FVE API."""
-
-    def __init__(self, hass: HomeAssistant, url: str, c_monitor: str, t_monitor: str):
-        """Initialize the API handler."""
-        self.hass = hass
-        self.url = url
-        self.payload = {
-            'c_monitor': c_monitor,
-            't_session': t_monitor
-        }
-        self.system_id = None # Will store a unique ID for device info
-        self.system_name = "Benekov FVE System"
-
-    def _http_post(self, url: str, data: dict, timeout: int = 10, verify: bool = True) -> str:
-        """Perform a minimal HTTP POST using sockets (supports HTTP and HTTPS).
-
-        Returns the response body as a string. Raises OSError/ssl.SSLError on network errors
-        or ValueError for unexpected HTTP responses.
-        """
-        parsed = urlparse(url)
-        scheme = parsed.scheme or "http"
-        host = parsed.hostname
-        port = parsed.port or (443 if scheme == "https" else 80)
-        path = parsed.path or "/"
-        if parsed.query:
-            path += "?" + parsed.query
-
-        body = urlencode(data or {}).encode("utf-8")
-
-        # Build request
-        request_lines = [f"POST {path} HTTP/1.1",
-                         f"Host: {host}",
-                         "User-Agent: benekov_fve/1.0",
-                         "Content-Type: application/x-www-form-urlencoded",
-                         f"Content-Length: {len(body)}",
-                         "Connection: close",
-                         "",
-                         ""]
-        request_header = "\r\n".join(request_lines).encode("utf-8")
-        req = request_header + body
-
-        # Open socket
-        sock = socket.create_connection((host, port), timeout)
-        try:
-            if scheme == "https":
-                if verify:
-                    ctx = ssl.create_default_context()
-                else:
-                    ctx = ssl._create_unverified_context()
-                sock = ctx.wrap_socket(sock, server_hostname=host)
-
-            # Send request
-            sock.sendall(req)
-
-            # Read response until EOF
-            response_chunks = []
-            while True:
-                chunk = sock.recv(4096)
-                if not chunk:
-                    break
-                response_chunks.append(chunk)
-
-            raw = b"".join(response_chunks)
-        finally:
-            try:
-                sock.close()
-            except Exception:
-                pass
-
-        # Split headers and body
-        sep = b"\r\n\r\n"
-        if sep not in raw:
-            raise ValueError("Invalid HTTP response")
-
-        header_raw, body = raw.split(sep, 1)
-        header_lines = header_raw.split(b"\r\n")
-        status_line = header_lines[0].decode(errors="ignore")
-        # Example: HTTP/1.1 200 OK
-        parts = status_line.split()
-        if len(parts) < 2:
-            raise ValueError(f"Invalid status line: {status_line}")
-        try:
-            status = int(parts[1])
-        except ValueError:
-            raise ValueError(f"Invalid status code in status line: {status_line}")
-
-        # Check for chunked transfer encoding
-        headers = {}
-        for h in header_lines[1:]:
-            if b":" in h:
-                k, v = h.split(b":", 1)
-                headers[k.decode().strip().lower()] = v.decode().strip()
-
-        if headers.get("transfer-encoding") == "chunked":
-            # Decode chunked body
-            body = self._decode_chunked(body)
-
-        # If status is not OK, raise
-        if status < 200 or status >= 300:
-            raise ValueError(f"HTTP {status}: {status_line}")
-
-        return body.decode("utf-8", errors="replace")
-
-    def _decode_chunked(self, raw: bytes) -> bytes:
-        """Decode an HTTP chunked transfer-encoded body."""
-        i = 0
-        out = bytearray()
-        length = len(raw)
-        while i < length:
-            # read chunk-size line
-            nl = raw.find(b"\r\n", i)
-            if nl == -1:
-                break
-            line = raw[i:nl].decode("ascii", errors="ignore").strip()
-            try:
-                chunk_size = int(line.split(";", 1)[0], 16)
-            except ValueError:
-                break
-            i = nl + 2
-            if chunk_size == 0:
-                # consume trailing CRLF after last chunk
-                break
-            out += raw[i:i+chunk_size]
-            i += chunk_size + 2
-        return bytes(out)
-
-    def get_data(self):
-        """Fetch and parse data synchronously (runs in HA executor)."""
-        try:
-            # 1. Fetch data via a socket-based POST to avoid relying on requests/urllib3
-            json_str = self._http_post(self.url, self.payload, timeout=10, verify=True)
-
-            # 2. Parse the JSON string
-            return self._parse_energy_status(json_str)
-
-        except (OSError, ssl.SSLError, ValueError) as e:
-            _LOGGER.error("Failed to fetch data from API (socket): %s", e)
-            raise UpdateFailed(f"API communication failed: {e}") from e
-        except Exception as e:
-            _LOGGER.exception("An unexpected error occurred during API call: %s", e)
-            raise UpdateFailed(f"Unexpected error: {e}") from e
-            
-    def _safe_get(self, d, keys, default=None):
-        """Accesses nested dictionary keys safely."""
-        # Be defensive: allow `keys` to be a single key (str) or iterable.
-        if keys is None:
-            return default
-
-        # If a string was passed, treat it as a single key
-        if isinstance(keys, str):
-            keys = [keys]
-
-        try:
-            iterator = iter(keys)
-        except TypeError:
-            # keys is not iterable
-            return default
-
-        for key in iterator:
-            if isinstance(d, dict) and key in d:
-                d = d[key]
-            else:
-                return default
-        return d
-
-    def _parse_energy_status(self, json_str):
-        """Parses the JSON string into a flat dictionary."""
-        try:
-            data = json.loads(json_str)
-        except json.JSONDecodeError:
-            _LOGGER.error("Failed to decode JSON from API: %s", json_str)
-            return {"error": "JSON_DECODE_FAILED"}
-
-        # Ensure we received a mapping/dictionary. If not, bail out early.
-        if not isinstance(data, dict):
-            _LOGGER.error("API returned non-dict JSON payload: %s", repr(data))
-            return {"error": "INVALID_PAYLOAD", "payload": data}
-
-        try:
-            # Store unique ID (uid) for the device
-            # Use the UID from the data, or a fallback.
-            self.system_id = data.get("uid", "unknown_benekov_system")
-            self.system_name = str(data.get("jmeno", "Benekov FVE System")).strip()
-
-            # Create the flat output dictionary
-            output = {
-                "user_name": str(data.get("jmeno", "Unknown User")).strip(),
-                "last_update": data.get("posledniZaznam", "N/A"),
-                "time_of_day": data.get("castDne", "N/A"),
-                "inverter_temp_c": self._safe_get(data, ["teplotaStridace"], 0.0),
-                "wifi_percent": data.get("wifiProc", 0),
-
-                # Power Flows (W)
-                "inverter_output_w": data.get("Inverter output total power", 0),
-                "total_consumption_w": data.get("spotrebaCelkem", 0),
-                "grid_power_w": data.get("vykonSit", 0),
-
-
-                # Battery Status
-                "battery_power_w": data.get("vykonBat", 0),
-                "battery_soc_percent": self._safe_get(data, ["baterie", "soc"], 0),
-                "battery_voltage_v": self._safe_get(data, ["baterie", "napeti"], 0.0),
-                "battery_current_a": self._safe_get(data, ["baterie", "proud"], 0.0),
-                "battery_temp_c": self._safe_get(data, ["baterie", "teplota"], 0),
-
-                # Daily Statistics (kWh)
-                "daily_purchase_kwh": self._safe_get(data, ["statistika", "denni", "NakupEnergie"], 0.0),
-                "daily_charge_kwh": self._safe_get(data, ["statistika", "denni", "NabitiBaterie"], 0.0),
-                "daily_discharge_kwh": self._safe_get(data, ["statistika", "denni", "VybitiBaterie"], 0.0),
-
-                # Solar Panel production
-                "fpv_power_total_w": self._safe_get(data, ["vykonFV"], 0),
-                "fpv_power_string_1_w": self._safe_get(data, ["vykonFV1"], 0),
-                "fpv_power_string_2_w": self._safe_get(data, ["vykonFV2"], 0),
-                "fpv_power_string_3_w": self._safe_get(data, ["vykonFV3"], 0),
-                "fpv_power_string_4_w": self._safe_get(data, ["vykonFV4"], 0),
+# (key, name, unit, device_class, state_attr_key) for each sensor
+SENSOR_SPECS = (
+    ("total_consumption_w", "Total Consumption", UNIT_WATT, DEVICE_CLASS_POWER, None),
+    ("grid_power_w", "Grid Power", UNIT_WATT, DEVICE_CLASS_POWER, None),
+    ("battery_power_w", "Battery Power", UNIT_WATT, DEVICE_CLASS_POWER, None),
+    ("battery_soc_percent", "Battery SOC", PERCENTAGE, DEVICE_CLASS_BATTERY, None),
+    ("battery_voltage_v", "Battery Voltage", UNIT_VOLT, DEVICE_CLASS_VOLTAGE, None),
+    ("battery_current_a", "Battery Current", UNIT_AMPERE, DEVICE_CLASS_CURRENT, None),
+    ("battery_temp_c", "Battery Temperature", UNIT_TEMP_C, DEVICE_CLASS_TEMPERATURE, None),
+    ("daily_purchase_kwh", "Daily Grid Purchase", UNIT_KWH, DEVICE_CLASS_ENERGY, "last_update"),
+    ("inverter_temp_c", "Inverter Temperature", UNIT_TEMP_C, DEVICE_CLASS_TEMPERATURE, None),
+    ("daily_charge_kwh", "Daily Battery Charge", UNIT_KWH, DEVICE_CLASS_ENERGY, None),
+    ("daily_discharge_kwh", "Daily Battery Discharge", UNIT_KWH, DEVICE_CLASS_ENERGY, None),
+    ("fpv_power_total_w", "Total Solar Panels Power", UNIT_WATT, DEVICE_CLASS_POWER, None),
+    ("fpv_power_string_1_w", "Solar Panels Power String 1", UNIT_WATT, DEVICE_CLASS_POWER, None),
+    ("fpv_power_string_2_w", "Solar Panels Power String 2", UNIT_WATT, DEVICE_CLASS_POWER, None),
+    ("fpv_power_string_3_w", "Solar Panels Power String 3", UNIT_WATT, DEVICE_CLASS_POWER, None),
+    ("fpv_power_string_4_w", "Solar Panels Power String 4", UNIT_WATT, DEVICE_CLASS_POWER, None),
+    ("fpv_voltage_string1_v", "Solar Panels Voltage String 1", UNIT_VOLT, DEVICE_CLASS_VOLTAGE, None),
+    ("fpv_voltage_string2_v", "Solar Panels Voltage String 2", UNIT_VOLT, DEVICE_CLASS_VOLTAGE, None),
+    ("fpv_voltage_string3_v", "Solar Panels Voltage String 3", UNIT_VOLT, DEVICE_CLASS_VOLTAGE, None),
+    ("fpv_voltage_string4_v", "Solar Panels Voltage String 4", UNIT_VOLT, DEVICE_CLASS_VOLTAGE, None),
+    # Diagnostic / status sensor
+    ("wifi_percent", "WiFi Signal", PERCENTAGE, None, None),
+)
 
-                "fpv_voltage_string1_v": self._safe_get(data, ["napetiFV1"], 0.0),
-                "fpv_voltage_string2_v": self._safe_get(data, ["napetiFV2"], 0.0),
-                "fpv_voltage_string3_v": self._safe_get(data, ["napetiFV3"], 0.0),
-                "fpv_voltage_string4_v": self._safe_get(data, ["napetiFV4"], 0.0),
-
-                # Unit Status
-                "unit_l1_v": self._safe_get(data, ["stridacL1Voltage"], 0),
-                "unit_l2_v": self._safe_get(data, ["stridacL2Voltage"], 0),
-                "unit_l3_v": self._safe_get(data, ["stridacL3Voltage"], 0.0),
-                "unit_frequency_hz": self._safe_get(data, ["stridacFrequency"], 0.0),
-                # Charger Status
-                "charger_2_status": self._safe_get(data, ["nabijecka", "nabijecka2", "stavKonektoru"], "N/A"),
-            }
-
-            return output
-        except Exception as e:
-            _LOGGER.exception("Unexpected error while parsing API response: %s", e)
-            return {"error": "PARSE_FAILED", "exception": str(e)}
 
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, async_add_entities):
     """Set up the sensor platform from a config entry."""
-    
-    url = config_entry.data[CONF_URL]
-    c_monitor = config_entry.data[CONF_USERNAME]
-    t_monitor = config_entry.data[CONF_PASSWORD]
-    scan_interval_s = config_entry.data.get("scan_interval", DEFAULT_SCAN_INTERVAL.seconds)
-    
-    # Renamed API class
-    api = BenekovFVEAPI(hass, url, c_monitor, t_monitor)
-    
-    async def _async_update_data():
-        """Wrapper to run the blocking `api.get_data` in the executor."""
-        result = await hass.async_add_executor_job(api.get_data)
-        _LOGGER.debug("BenekovFVE: _async_update_data result type=%s", type(result))
-        return result
-
-    coordinator = DataUpdateCoordinator(
-        hass,
-        _LOGGER,
-        name="Benekov FVE Monitor",
-        update_method=_async_update_data,
-        update_interval=timedelta(seconds=scan_interval_s),
+    # The API handler and coordinator are created (and the first refresh
+    # performed) by `async_setup_entry` in `__init__.py`.
+    entry_container = hass.data[DOMAIN][config_entry.entry_id]
+    api = entry_container["api"]
+    coordinator = entry_container["coordinator"]
+
+    # One DeviceInfo shared by every sensor of this entry
+    device_info = DeviceInfo(
+        identifiers={(api.system_id, "BenekovFVE")},
+        name=api.system_name,
+        manufacturer="Benekov",
+        model="FVE Monitoring Inverter",
     )
 
-    # Do NOT perform an initial blocking refresh here. The integration's
-    # `async_setup_entry` in `__init__.py` already validated connectivity.
-    # Performing `async_config_entry_first_refresh` here can raise
-    # `ConfigEntryNotReady` from the platform which we prefer to avoid.
-    # Let the coordinator handle its first update on its own schedule.
-
-    # Store coordinator for later access/unload
-    try:
-        from .const import DOMAIN
-    except Exception:
-        DOMAIN = "benekov_fve"
-
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN].setdefault(config_entry.entry_id, {})
-    # store coordinator in the mutable container for this entry
-    hass.data[DOMAIN][config_entry.entry_id]["coordinator"] = coordinator
-
     # Create sensors for each metric
     entry_id = config_entry.entry_id
 
     entities = [
-        # Renamed Sensor class; pass stable entry_id for unique IDs
-        BenekovFVESensor(entry_id, coordinator, api, "total_consumption_w", "Total Consumption", UNIT_WATT, DEVICE_CLASS_POWER),
-        BenekovFVESensor(entry_id, coordinator, api, "grid_power_w", "Grid Power", UNIT_WATT, DEVICE_CLASS_POWER),
-        BenekovFVESensor(entry_id, coordinator, api, "battery_power_w", "Battery Power", UNIT_WATT, DEVICE_CLASS_POWER),
-        BenekovFVESensor(entry_id, coordinator, api, "battery_soc_percent", "Battery SOC", PERCENTAGE, DEVICE_CLASS_BATTERY),
-        BenekovFVESensor(entry_id, coordinator, api, "battery_voltage_v", "Battery Voltage", UNIT_VOLT, DEVICE_CLASS_VOLTAGE),
-        BenekovFVESensor(entry_id, coordinator, api, "battery_current_a", "Battery Current", UNIT_AMPERE, DEVICE_CLASS_CURRENT),
-        BenekovFVESensor(entry_id, coordinator, api, "battery_temp_c", "Battery Temperature", UNIT_TEMP_C, DEVICE_CLASS_TEMPERATURE),
-        BenekovFVESensor(entry_id, coordinator, api, "daily_purchase_kwh", "Daily Grid Purchase", UNIT_KWH, DEVICE_CLASS_ENERGY, state_attr_key="last_update"),
-        BenekovFVESensor(entry_id, coordinator, api, "inverter_temp_c", "Inverter Temperature", UNIT_TEMP_C, DEVICE_CLASS_TEMPERATURE),
-        BenekovFVESensor(entry_id, coordinator, api, "daily_charge_kwh", "Daily Battery Charge", UNIT_KWH, DEVICE_CLASS_ENERGY),
-        BenekovFVESensor(entry_id, coordinator, api, "daily_discharge_kwh", "Daily Battery Discharge", UNIT_KWH, DEVICE_CLASS_ENERGY),
-        BenekovFVESensor(entry_id, coordinator, api, "fpv_power_total_w", "Total Solar Panels Power", UNIT_WATT, DEVICE_CLASS_POWER),
-        BenekovFVESensor(entry_id, coordinator, api, "fpv_power_string_1_w", "Solar Panels Power String 1", UNIT_WATT, DEVICE_CLASS_POWER),
-        BenekovFVESensor(entry_id, coordinator, api, "fpv_power_string_2_w", "Solar Panels Power String 2", UNIT_WATT, DEVICE_CLASS_POWER),
-        BenekovFVESensor(entry_id, coordinator, api, "fpv_power_string_3_w", "Solar Panels Power String 3", UNIT_WATT, DEVICE_CLASS_POWER),
-        BenekovFVESensor(entry_id, coordinator, api, "fpv_power_string_4_w", "Solar Panels Power String 4", UNIT_WATT, DEVICE_CLASS_POWER),
-        BenekovFVESensor(entry_id, coordinator, api, "fpv_voltage_string1_v", "Solar Panels Voltage String 1", UNIT_VOLT, DEVICE_CLASS_VOLTAGE),
-        BenekovFVESensor(entry_id, coordinator, api, "fpv_voltage_string2_v", "Solar Panels Voltage String 2", UNIT_VOLT, DEVICE_CLASS_VOLTAGE),
-        BenekovFVESensor(entry_id, coordinator, api, "fpv_voltage_string3_v", "Solar Panels Voltage String 3", UNIT_VOLT, DEVICE_CLASS_VOLTAGE),
-        BenekovFVESensor(entry_id, coordinator, api, "fpv_voltage_string4_v", "Solar Panels Voltage String 4", UNIT_VOLT, DEVICE_CLASS_VOLTAGE),
-        # Diagnostic / status sensor
-        BenekovFVESensor(entry_id, coordinator, api, "wifi_percent", "WiFi Signal", PERCENTAGE, None),
+        # Pass stable entry_id for unique IDs
+        BenekovFVESensor(entry_id, coordinator, device_info, *spec)
+        for spec in SENSOR_SPECS
     ]
 
-    async_add_entities(entities)
+    # The coordinator already holds fresh data; no per-entity update needed
+    async_add_entities(entities, update_before_add=False)
 
 
 class BenekovFVESensor(SensorEntity):
     """Representation of a sensor from the Benekov FVE system."""
-    def __init__(self, entry_id: str, coordinator, api: BenekovFVEAPI, key: str, name: str, unit: str, device_class: str = None, state_attr_key: str = None):
-        """Initialize the sensor."""
+
+    # Updates are pushed by the coordinator; never poll the entity itself
+    _attr_should_poll = False
+
+    def __init__(self, entry_id: str, coordinator, device_info: DeviceInfo, key: str, name: str, unit: str, device_class: str = None, state_attr_key: str = None):
+        """Initialize the sensor.
+
+        Static entity metadata is computed once here and exposed through
+        Home Assistant's `_attr_*` attributes instead of per-read properties.
+        """
         self._entry_id = entry_id
         self.coordinator = coordinator
-        self._api = api
         self._key = key
-        self._name = name
-        self._unit = unit
-        self._device_class = device_class
         self._state_attr_key = state_attr_key
 
-    @property
-    def name(self):
-        """Return the name of the sensor."""
         # Use the system name + the metric name
-        return f"{self._api.system_name} {self._name}"
-
-    @property
-    def unique_id(self) -> str:
-        """Return a unique ID for this sensor."""
+        self._attr_name = f"{device_info['name']} {name}"
         # Use the config entry id + key for a stable unique id that
         # does not change between restarts or before the API provides a UID.
-        entry_part = getattr(self, "_entry_id", "unknown_entry")
-        return f"benekov_fve_{entry_part}_{self._key}"
+        self._attr_unique_id = f"benekov_fve_{entry_id}_{key}"
+        self._attr_native_unit_of_measurement = unit
+        self._attr_device_class = device_class
+        self._attr_device_info = device_info
 
     @property
-    def state(self):
+    def native_value(self):
         """Return the state of the sensor."""
         # Get the value from the coordinator's data
         data = getattr(self.coordinator, "data", None)
@@ -383,44 +114,18 @@ class BenekovFVESensor(SensorEntity):
             return None
         return data.get(self._key)
 
-    @property
-    def unit_of_measurement(self):
-        """Return the unit of measurement."""
-        return self._unit
-
-    @property
-    def device_class(self):
-        """Return the device class."""
-        return self._device_class
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information for the system."""
-        return DeviceInfo(
-            identifiers={(self._api.system_id, "BenekovFVE")},
-            name=self._api.system_name,
-            manufacturer="Benekov",
-            model="FVE Monitoring Inverter",
-        )
-
     @property
     def extra_state_attributes(self):
-        """Return the state attributes."""
-        # For the daily purchase sensor, also show the last update time as an attribute
-        data = getattr(self.coordinator, "data", {}) or {}
-        # For the daily purchase sensor, also show the last update time as an attribute
-        attrs = {
-            "Charger 2 Status": data.get("charger_2_status"),
-            "Time of Day": data.get("time_of_day"),
-        }
-        if self._state_attr_key and data.get(self._state_attr_key):
-            attrs["Last Update Time"] = data.get(self._state_attr_key)
-        return attrs
+        """Return the state attributes (shared per poll, read-only)."""
+        return self.coordinator.shared_attributes(self._state_attr_key)
 
     async def async_added_to_hass(self):
         """When entity is added to hass."""
-        # Register the update listener for the coordinator
-        self.async_on_remove(self.coordinator.async_add_listener(self.async_write_ha_state))
+        # Register the update listener for the coordinator. Pass the key as
+        # context so the coordinator knows this sensor still wants data.
+        self.async_on_remove(
+            self.coordinator.async_add_listener(self.async_write_ha_state, self._key)
+        )
 
     async def async_update(self):
         """Update the entity. Only used by the coordinator."""